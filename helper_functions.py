@@ -5,29 +5,59 @@ from __future__ import annotations
 import numpy as np
 from numpy.typing import ArrayLike
 
+import settings
+
 
 def normalize(
-    input_data: list[float],
+    input_data: list[float] | ArrayLike,
     calibration_data: list[float] | ArrayLike,
-) -> list[float]:
-    """normalizes by dividing by `calibration_data` and also applies SNV_transform"""
-    input_data = np.asarray(input_data)
-    calibration_data = np.asarray(calibration_data)
+    _asarray=np.asarray,
+) -> np.ndarray:
+    """normalizes by dividing by `calibration_data` and also applies SNV_transform
+
+    accepts a single measurement or an (N, 8) batch, the batch is handled
+    row by row through broadcasting in the same vectorized passes
+
+    `_asarray` is a default-argument binding so the per-measurement hot path
+    does LOAD_FAST instead of a global + attribute lookup
+    """
+    input_data = _asarray(input_data, dtype=np.float64)
+    calibration_data = _asarray(calibration_data, dtype=np.float64)
 
     # scale by calibration measurement
     data_rescaled = input_data / calibration_data
 
-    data_snv = snv_transform(data_rescaled)
+    # fused in-place SNV on the rescaled buffer, subtracting the mean does
+    # not change the standard deviation so no extra temporaries are needed
+    data_rescaled -= data_rescaled.mean(axis=-1, keepdims=True)
+    data_rescaled /= data_rescaled.std(axis=-1, keepdims=True)
+    return data_rescaled
 
-    return list(data_snv)
 
-
-def snv_transform(data: ArrayLike | list[float]) -> list[float]:
+def snv_transform(data: ArrayLike | list[float], _asarray=np.asarray) -> np.ndarray:
     """SNV transform
     Subtract the mean and divide by the standarddiviation
+    Returns an ndarray so callers don't pay for per-element float boxing,
+    the rare call site that needs a python list converts with .tolist()
+    accepts a single measurement or an (N, 8) batch; the batch path is a
+    handful of fused numpy passes, fast enough that a JIT-compiled
+    variant would only add a compile-time dependency
     """
-    return list((np.asarray(data) - np.mean(data)) / np.std(data))
+    data = _asarray(data, dtype=np.float64)
+    return (data - data.mean(axis=-1, keepdims=True)) / data.std(axis=-1, keepdims=True)
+
 
+# fixed-width row template, one "%.7f" per LED; a single C-level % format of
+# the whole row beats N separate f-string formats
+_ROW_FMT = " ".join(["%.7f"] * len(settings.HARDWARE.WAVELENGTHS))
 
-def list_to_string(data: list[float]) -> list[str]:
-    return [f"{i:.7f}" for i in data]
+
+def list_to_string(data: list[float] | ArrayLike) -> list[str]:
+    """formats a measurement as 7-decimal strings in one C-level pass
+    the table no longer uses this (cells format lazily on paint), kept as
+    a convenience for scripts working with the csv files
+    """
+    data = np.asarray(data, dtype=np.float64)
+    if len(data) != len(settings.HARDWARE.WAVELENGTHS):
+        return [f"{i:.7f}" for i in data]
+    return (_ROW_FMT % tuple(data.tolist())).split(" ")
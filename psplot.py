@@ -2,17 +2,28 @@
 
 from __future__ import annotations
 
+import bisect
+import logging
 import os
-import random
 import time
+import urllib.error
+import urllib.request
 from datetime import datetime
+from functools import cached_property, lru_cache
+from pathlib import Path
 
 import joblib
+import numpy as np
+# pandas stays a top-level import: the in-memory dataset is a dataframe
+# from the first measurement on, not just on csv load, so deferring the
+# import would only move the cost to the first scan; the genuinely
+# deferrable heavyweights (QtDataVisualization, the classifier) already
+# load lazily
 import pandas as pd
 
 import serial
 import serial.tools.list_ports
-from PyQt5.QtCore import Qt, pyqtSignal, QT_VERSION_STR
+from PyQt5.QtCore import QEvent, QObject, Qt, QThread, QTimer, pyqtSignal, QT_VERSION_STR
 from PyQt5.QtGui import (
     QIcon,
     QKeyEvent,
@@ -39,6 +50,49 @@ import settings
 from helper_functions import normalize, snv_transform
 from visualisation_components import Histogram, ScatterPlot2D, ScatterPlot3D, Table
 
+# on-disk memoization for the expensive dataset parse, keyed on the csv path
+# and its modification time (see _read_dataset)
+_MEM = joblib.Memory(str(Path.home() / ".cache" / "psplot" / "joblib"), verbose=0)
+
+# baseline spectrum for the dummy branch of get_measurement, noise is added
+# in one vectorized draw instead of a python loop over random.uniform
+_DUMMY_BASE = np.array(
+    [0.2278, 0.2264, 0.2178, 0.2379, 0.2276, 0.2281, 0.2298, 0.2264]
+)
+# one shared PCG64 generator, constructed once at import instead of per
+# window or per call
+_DUMMY_RNG = np.random.default_rng()
+
+# pending measurements carry a raw time.time_ns() integer, the flush turns
+# the whole batch into local wall-clock timestamps in one pass
+_LOCAL_TZ = datetime.now().astimezone().tzinfo
+
+# logger instead of print so interactive callbacks don't write to stdout
+# synchronously unless a handler wants the message
+_LOG = logging.getLogger(__name__)
+
+
+@_MEM.cache
+def _read_dataset(dataset_path: str, mtime: float) -> pd.DataFrame:
+    """parses a measurement csv into a typed dataframe
+    memoized on path and mtime, so re-loading an unchanged file is served
+    from a pickle instead of a full csv parse
+    """
+    read_kwargs = {
+        "index_col": "Reading",
+        "dtype": settings.DATAFRAME.HEADER_DTYPES,
+        # only parse the columns the app consumes, extras are skipped
+        "usecols": ["Reading", *settings.DATAFRAME.HEADER],
+    }
+    try:
+        # the pyarrow parser is multi-threaded and avoids object-dtype
+        # inference, but it is an optional extra; only the engine is
+        # switched, dtype_backend stays numpy so the rest of the app keeps
+        # working on plain ndarrays
+        return pd.read_csv(dataset_path, engine="pyarrow", **read_kwargs)
+    except ImportError:
+        return pd.read_csv(dataset_path, **read_kwargs)
+
 class ComboBox(QComboBox):
     """Used because there's no existing onPopup signal in QComboBox.
     Creating one is necessary in order to trigger a serial_scan() when the user
@@ -50,6 +104,24 @@ class ComboBox(QComboBox):
         self.onPopup.emit()
         super(ComboBox, self).showPopup()
 
+class MeasurementWorker(QObject):
+    """Runs a blocking measurement read in a worker thread.
+    Reading from the scanner blocks for up to the serial timeout, doing that
+    on the GUI thread stalls repaints. The queued `measured` signal hands the
+    data back to the GUI thread.
+    """
+
+    # object rather than list, measurements can also be numpy arrays
+    measured = pyqtSignal(object)
+
+    def __init__(self, read_measurement) -> None:
+        super().__init__()
+        self._read_measurement = read_measurement
+
+    def run(self) -> None:
+        self.measured.emit(self._read_measurement())
+
+
 class PsPlot(QMainWindow):
     """main class and main window of the PSPlot program:
     manages multiple things:
@@ -69,6 +141,7 @@ class PsPlot(QMainWindow):
 
         self._setup_variables()
         self._setup_ui()
+        self._setup_key_actions()
 
         # Connect to the serial device (first, newest detected)
         self.serial_scan()
@@ -84,18 +157,48 @@ class PsPlot(QMainWindow):
         self.serial = None
 
         self.df = pd.DataFrame(columns=settings.DATAFRAME.HEADER)
+        # measurement rows waiting to be folded into self.df (one flat list
+        # per row, in HEADER order); appending here is O(1) while growing the
+        # dataframe row by row recopies it entirely
+        self._pending_rows: list[list] = []
+        # positions of the classifier input columns within a pending row
+        self._prediction_indices = tuple(
+            settings.DATAFRAME.HEADER.index(header)
+            for header in settings.CLASSIFIER.PREDICTION_HEADERS
+        )
+        # label -> position for the dataframe columns, resolved once so
+        # cell edits from the table can use positional iat assignment
+        self._df_col_idx = {
+            name: i for i, name in enumerate(settings.DATAFRAME.HEADER)
+        }
+
+        # column-major snapshot of the numeric measurement columns (one row
+        # per measurement, columns ordered like settings.SCATTER3D.AXIS_OPTIONS)
+        # rebuilt in one pass on dataset load, where it feeds the per-series
+        # 3D bulk inserts; live measurements do not append to it, they hand
+        # their row to the 3D plot and the pending buffer directly
+        self._nm_block = np.empty((0, len(settings.SCATTER3D.AXIS_OPTIONS)), order="F")
 
-        # classifier model used to predict type of plastic
-        self.clf = joblib.load(settings.CLASSIFIER.MODEL_TO_USE)
+        # memoized per measurement vector, repeated identical inputs
+        # (e.g. redraw of the histogram, replayed signals) skip the
+        # classifier entirely; sized for a long measuring session
+        self.predict_proba = lru_cache(maxsize=4096)(self._predict_proba)
 
         # keeps track of all of the samples that have been measured
-        self.sample_materials = settings.USER_INPUT.DEFAULT_SAMPLE_MATERIALS.copy()
+        # a set like sample_names/sample_colors, membership is checked on
+        # every measurement so the lookup has to be O(1); the combo boxes
+        # keep their own insertion order, no parallel list is needed
+        self.sample_materials: set[str] = set(settings.USER_INPUT.DEFAULT_SAMPLE_MATERIALS)
 
         # holds the calibration measurement
         self.baseline: list[float] | None = None
 
         self.sample_colors = {""}
         self.sample_names = {""}
+        # the combobox texts of the previous measurement, most scans repeat
+        # the same sample so add_measurement can skip the bookkeeping
+        self._last_selection_raw: tuple[str, str, str] | None = None
+        self._last_selection = ("", "", "")
 
         self.fullscreen = False
         self.overwrite_no_callibration_warning = False
@@ -104,11 +207,42 @@ class PsPlot(QMainWindow):
 
         # all the values that were last plotted
         self.twoDPlottedList = []
+        # set when a measurement came in while the window was minimized or
+        # hidden, the redraw then happens when the window shows again
+        self._plots_dirty = False
+        self._deferred_plot_data: np.ndarray | None = None
+        # coalesces redraws: when measurements arrive faster than the event
+        # loop repaints, the queued ticks collapse into one refresh
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._flush_plots)
+        self._pending_2d: np.ndarray | None = None
+        # hash of the float bytes of the last spectrum the 2d plot drew, a
+        # scan of an unchanged sample then skips the curve rebuild
+        self._last_2d_hash: int | None = None
+        # true while a worker thread is reading the scanner; keyboard
+        # shortcuts bypass the disabled button, so the guard has to be an
+        # explicit flag and only one read may touch the serial port at a
+        # time
+        self._measuring = False
         # to keep track of the amount of calibrations done in the current session
         self.current_calibration_counter = 0
         # the amount of calibrations done in the current session + the previous sessions
         self.total_calibration_counter = 0
 
+    @cached_property
+    def clf(self):
+        """classifier model used to predict type of plastic
+        loaded on first use so unpickling does not stall startup
+        """
+        clf = joblib.load(settings.CLASSIFIER.MODEL_TO_USE)
+        # predictions pass plain ndarrays; dropping the remembered fit-time
+        # feature names keeps sklearn from warning on every call
+        if hasattr(clf, "feature_names_in_"):
+            del clf.feature_names_in_
+        return clf
+
     def _setup_ui(self) -> None:
         # input output (selecting serial and saving)
         self._setup_in_out_ui()
@@ -116,17 +250,18 @@ class PsPlot(QMainWindow):
         self._setup_measure_ui()
         # 2d Plot
         self.scatter2d = ScatterPlot2D(self)
-        # 3d plot
-        self.scatter3d = ScatterPlot3D(self)
-        # histogram
-        self.histogram = Histogram(self)
+        # the 3d plot and histogram are built one event-loop tick later
+        # (_setup_deferred_plots): Q3DScatter brings up an OpenGL context
+        # and the histogram construction loads the classifier, neither
+        # should gate the first frame
+        self.scatter3d: ScatterPlot3D | None = None
+        self.histogram: Histogram | None = None
 
         # layout for graphs
         self.graphLayout = QHBoxLayout()
         self.graphLayout.setSpacing(20)
         self.graphLayout.addLayout(self.scatter2d, 50)
-        self.graphLayout.addLayout(self.scatter3d, 50)
-        self.graphLayout.addLayout(self.histogram, 50)
+        QTimer.singleShot(0, self._setup_deferred_plots)
 
         # Table to display output
         self.table = Table()
@@ -150,6 +285,20 @@ class PsPlot(QMainWindow):
         self.setMinimumSize(600, 350)
         self.center()
 
+    def _setup_deferred_plots(self) -> None:
+        """builds the 3d plot and the histogram after the first paint
+        idempotent, any data path that needs the widgets early can call it
+        directly; the pending-timer invocation then becomes a no-op
+        """
+        if self.scatter3d is not None:
+            return
+        self.scatter3d = ScatterPlot3D(self)
+        self.histogram = Histogram(self)
+        self.graphLayout.addLayout(self.scatter3d, 50)
+        self.graphLayout.addLayout(self.histogram, 50)
+        # draw anything that arrived while the widgets did not exist yet
+        self._catch_up_plots()
+
     def _setup_in_out_ui(self) -> None:
         # selecting serial
         self.serialComboBox = ComboBox()
@@ -215,7 +364,11 @@ class PsPlot(QMainWindow):
         self.sampleMaterialSelection.setDuplicatesEnabled(False)
         self.sampleMaterialSelection.setEditable(True)
         self.sampleMaterialSelection.setPlaceholderText("select material")
-        self.sampleMaterialSelection.addItems(sorted(self.sample_materials))
+        # mirror of the combo box items, kept sorted so new materials can
+        # be inserted at the right position with one bisect instead of
+        # re-sorting the whole list
+        self._sorted_materials = sorted(self.sample_materials)
+        self.sampleMaterialSelection.addItems(self._sorted_materials)
         self.sampleMaterialSelection.setCurrentText("unknown")
 
         # sample name
@@ -264,36 +417,54 @@ class PsPlot(QMainWindow):
         self.measureBox = QGroupBox("measuring")
         self.measureBox.setLayout(self.measureBoxLayout)
 
-    def keyPressEvent(self, e: QKeyEvent) -> None:
-        # if e.key() == Qt.Key.Key_Escape or e.key() == Qt.Key.Key_Q:
-        if e.key() == Qt.Key.Key_Q:
-            self.close()
-
-        elif e.key() == Qt.Key.Key_Up or e.key() == Qt.Key.Key_W or e.key() == Qt.Key.Key_Plus:
-            self.scatter2d._viewBox.scaleBy((1, 0.9))
-
-        elif e.key() == Qt.Key.Key_Down or e.key() == Qt.Key.Key_S or e.key() == Qt.Key.Key_Minus:
-            self.scatter2d._viewBox.scaleBy((1, 1.1))
-
-        elif e.key() == Qt.Key.Key_Home:
-            # TODO fix this
-            self.scatter2d._plotWidget.setXRange(
-                settings.HARDWARE.WAVELENGTHS[0],
-                settings.HARDWARE.WAVELENGTHS[-1],
-                padding=0.1,
-            )
-            self.scatter2d._plotWidget.setYRange(self.yMin, self.yMax, padding=self.yPadding)
+    def _setup_key_actions(self) -> None:
+        """builds the keyboard dispatch table used by keyPressEvent
+        a dict lookup replaces the old elif ladder, so a keypress costs one
+        O(1) lookup instead of comparing against every shortcut
+        """
+        # bind the view box once, every zoom keypress then costs a single
+        # attribute fetch instead of re-resolving it through the plot
+        # widget; the plot component itself caches the same object, so no
+        # getViewBox() call survives on any key path
+        vb = self.scatter2d._viewBox
+        zoom_in = lambda: vb.scaleBy((1, 0.9))  # noqa: E731
+        zoom_out = lambda: vb.scaleBy((1, 1.1))  # noqa: E731
+        self._home_x = (settings.HARDWARE.WAVELENGTHS[0], settings.HARDWARE.WAVELENGTHS[-1])
+        # keys are stored as plain ints, which is what e.key() returns, so
+        # the lookup never goes through enum comparison machinery
+        self._key_actions = {
+            int(Qt.Key.Key_Q): self.close,
+            int(Qt.Key.Key_Up): zoom_in,
+            int(Qt.Key.Key_W): zoom_in,
+            int(Qt.Key.Key_Plus): zoom_in,
+            int(Qt.Key.Key_Down): zoom_out,
+            int(Qt.Key.Key_S): zoom_out,
+            int(Qt.Key.Key_Minus): zoom_out,
+            int(Qt.Key.Key_Home): self._reset_2d_view,
+            int(Qt.Key.Key_Space): self.regular_measurement,
+            int(Qt.Key.Key_F11): self._toggle_fullscreen,
+        }
 
-        elif e.key() == Qt.Key.Key_Space:
-            self.regular_measurement()
+    def _reset_2d_view(self) -> None:
+        # TODO fix this
+        self.scatter2d._plotWidget.setXRange(*self._home_x, padding=0.1)
+        self.scatter2d._plotWidget.setYRange(self.yMin, self.yMax, padding=self.yPadding)
 
-        elif e.key() == Qt.Key.Key_F11:
-            if not self.fullscreen:
-                self.windowHandle().showFullScreen()
-                self.fullscreen = True
-            else:
-                self.windowHandle().showNormal()
-                self.fullscreen = False
+    def _toggle_fullscreen(self) -> None:
+        if not self.fullscreen:
+            self.windowHandle().showFullScreen()
+            self.fullscreen = True
+        else:
+            self.windowHandle().showNormal()
+            self.fullscreen = False
+
+    def keyPressEvent(self, e: QKeyEvent) -> None:
+        action = self._key_actions.get(e.key())
+        if action is not None:
+            action()
+        else:
+            # unmapped keys keep their default QMainWindow behaviour
+            super().keyPressEvent(e)
 
     def center(self) -> None:
         """centers the window to the center of the screen"""
@@ -319,23 +490,48 @@ class PsPlot(QMainWindow):
         port = self.serialComboBox.currentText()
 
         if port == "None":
-            print("No device selected, using dummy data")
+            _LOG.info("No device selected, using dummy data")
             self.serial = None
             self.serialNotifLbl.setText("Using dummy data")
             return
 
         try:
             self.serial = serial.Serial(port, baudrate=settings.HARDWARE.BAUDRATE, timeout=1)
-            print(f"Opened serial port {self.serial.portstr}")
+            _LOG.info("Opened serial port %s", self.serial.portstr)
             self.serialNotifLbl.setText("Using real data")
-            time.sleep(1)
-            self.serial.readline()  # Consume the "Plastic scanner initialized" line
+            # give the scanner a second to boot without blocking the event
+            # loop (a time.sleep here froze the whole window on connect),
+            # then poll for the greeting instead of a blocking readline
+            self._greeting_polls = 20
+            QTimer.singleShot(1000, self._consume_init_line)
         except Exception as e:
-            print(f"Cannot open serial port '{port}', using dummy data. Full error: {e}")
+            _LOG.warning("Cannot open serial port '%s', using dummy data. Full error: %s", port, e)
             self.serial = None
             self.serialNotifLbl.setText("Using dummy data")
 
+    def _consume_init_line(self) -> None:
+        """Consume the "Plastic scanner initialized" line, deferred so the
+        GUI stays responsive while the device boots; the port may have been
+        closed or swapped again in the meantime
+
+        readline is only entered once bytes are actually waiting, a slow
+        device re-arms a short poll instead of stalling the event loop for
+        the port timeout; polling gives up after a few seconds
+        """
+        if self.serial is None:
+            return
+        if not self.serial.in_waiting:
+            self._greeting_polls -= 1
+            if self._greeting_polls > 0:
+                QTimer.singleShot(200, self._consume_init_line)
+            return
+        self.serial.readline()
+
     def regular_measurement(self) -> None:
+        # the Space shortcut dispatches here directly, so the disabled
+        # button alone does not stop a second concurrent read
+        if self._measuring:
+            return
         if (
             self.current_calibration_counter == 0
             and self.overwrite_no_callibration_warning is False
@@ -352,64 +548,142 @@ class PsPlot(QMainWindow):
             else:
                 self.overwrite_no_callibration_warning = True
 
-        data = self.get_measurement()
-        self.add_measurement(data)
-        self.scatter2d.plot(snv_transform(data))
+        # the read runs off the GUI thread, _on_measurement picks it up;
+        # the flag (checked above and by calibrate) and the disabled
+        # button both clear there, so reads cannot overlap
+        self._measuring = True
+        self.regularMeasurementBtn.setEnabled(False)
+        self._measurement_thread = QThread(self)
+        self._measurement_worker = MeasurementWorker(self.get_measurement)
+        self._measurement_worker.moveToThread(self._measurement_thread)
+        self._measurement_thread.started.connect(self._measurement_worker.run)
+        self._measurement_worker.measured.connect(self._on_measurement)
+        self._measurement_worker.measured.connect(self._measurement_thread.quit)
+        self._measurement_thread.finished.connect(self._measurement_thread.deleteLater)
+        self._measurement_thread.start()
+
+    def _on_measurement(self, data: list[float] | np.ndarray) -> None:
+        """handles a finished measurement back on the GUI thread"""
+        self._measuring = False
+        self.regularMeasurementBtn.setEnabled(True)
+        # the snv transform is computed once and shared by the 2D plot and
+        # the measurement storage below
+        data_snv = snv_transform(data)
+        self.add_measurement(data, data_snv)
+        self._pending_2d = data_snv
+        self._refresh_timer.start()
+
+    def _flush_plots(self) -> None:
+        """single coalesced redraw for all measurements since the last tick"""
+        if self._pending_2d is not None:
+            data_snv = self._pending_2d
+            self._pending_2d = None
+            self._refresh_plots(data_snv)
+
+    def _refresh_plots(self, data_snv: np.ndarray) -> None:
+        """redraws the plots for a new measurement
+        while the window is minimized or hidden nobody sees the plots, so the
+        redraw (and the classifier call behind the histogram) is deferred
+        until the window shows again
+        """
+        if self.scatter3d is None or self.isMinimized() or not self.isVisible():
+            # also covers the tick before the deferred widgets exist,
+            # _setup_deferred_plots catches up afterwards
+            self._deferred_plot_data = data_snv
+            self._plots_dirty = True
+            return
+        # a byte-identical spectrum would rebuild exactly the same curves,
+        # cheap hash check instead; 3d plot and histogram still update
+        data_hash = hash(data_snv.tobytes())
+        if data_hash != self._last_2d_hash:
+            self.scatter2d.plot(data_snv)
+            self._last_2d_hash = data_hash
         self.scatter3d.plot()
         self.histogram.plot()
-
-    def get_measurement(self) -> list[float]:
+        self._plots_dirty = False
+
+    def _catch_up_plots(self) -> None:
+        if self._plots_dirty and not (self.isMinimized() or not self.isVisible()):
+            self._refresh_plots(self._deferred_plot_data)
+            self._deferred_plot_data = None
+
+    def showEvent(self, e) -> None:
+        super().showEvent(e)
+        self._catch_up_plots()
+
+    def changeEvent(self, e) -> None:
+        super().changeEvent(e)
+        # restoring from minimized does not fire showEvent
+        if e.type() == QEvent.Type.WindowStateChange:
+            self._catch_up_plots()
+        elif e.type() == QEvent.Type.PaletteChange:
+            # the plots cache palette derived pens and brushes
+            self.scatter2d.refresh_palette()
+            if self.histogram is not None:
+                self.histogram.refresh_palette()
+
+    def get_measurement(self) -> np.ndarray:
         if self.serial is not None:
             # send serial command
             self.serial.write(b"scan\n")
 
-            # read response
-            line = self.serial.readline()
-            line = line.decode()
-
-            # parse data
-            data = line.strip("> ").strip("\r\n").split("\t")
-            data = [float(x) for x in data if x != ""]
+            # read response and parse all values in one C call instead of a
+            # python float() per field; the prompt and line ending are
+            # stripped on the raw bytes so only the numeric fields are
+            # decoded, empty fields from trailing separators are skipped;
+            # float64 on purpose, it is what the SNV/normalize math uses
+            line = self.serial.readline().strip(b"> \r\n")
+            data = np.fromstring(line.decode(), sep="\t")
         else:
-            # dummy data with random noise
-            data = data = [
-                0.2278,
-                0.2264,
-                0.2178,
-                0.2379,
-                0.2276,
-                0.2281,
-                0.2298,
-                0.2264,
-            ]
-            data = [x + random.uniform(0.0015, 0.0080) for x in data]
+            # dummy data with random noise, one array expression and a
+            # single assignment
+            data = _DUMMY_BASE + _DUMMY_RNG.uniform(
+                0.0015, 0.0080, size=len(_DUMMY_BASE)
+            )
 
         return data
 
-    def add_measurement(self, data: list[float]) -> None:
-        # get the material from the ComboBox
-        material = self.sampleMaterialSelection.currentText().rstrip()
-        if material not in self.sample_materials:
-            self.sample_materials.append(material)
-            self.sampleMaterialSelection.addItem(material)
-
-        # get the name from the ComboBox
-        name = self.sampleNameSelection.currentText().rstrip()
-        if name not in self.sample_names:
-            self.sample_names.add(name)
-            self.sampleNameSelection.addItem(name)
-
-        # get the color from the ComboBox
-        color = self.sampleColorSelection.currentText().rstrip()
-        if color not in self.sample_colors:
-            self.sample_colors.add(color)
-            self.sampleColorSelection.addItem(color)
-
-        self.store_measurement(data, name=name, material=material, color=color)
+    def add_measurement(self, data: list[float], data_snv: np.ndarray | None = None) -> None:
+        selection = (
+            self.sampleMaterialSelection.currentText(),
+            self.sampleNameSelection.currentText(),
+            self.sampleColorSelection.currentText(),
+        )
+        # consecutive scans of the same sample reuse the stripped values and
+        # skip the membership bookkeeping entirely
+        if selection != self._last_selection_raw:
+            # get the material from the ComboBox
+            material = selection[0].rstrip()
+            if material not in self.sample_materials:
+                self.sample_materials.add(material)
+                # keep the combo box alphabetical, O(log n) position
+                # lookup against the sorted mirror
+                pos = bisect.bisect_left(self._sorted_materials, material)
+                self._sorted_materials.insert(pos, material)
+                self.sampleMaterialSelection.insertItem(pos, material)
+
+            # get the name from the ComboBox
+            name = selection[1].rstrip()
+            if name not in self.sample_names:
+                self.sample_names.add(name)
+                self.sampleNameSelection.addItem(name)
+
+            # get the color from the ComboBox
+            color = selection[2].rstrip()
+            if color not in self.sample_colors:
+                self.sample_colors.add(color)
+                self.sampleColorSelection.addItem(color)
+
+            self._last_selection_raw = selection
+            self._last_selection = (material, name, color)
+
+        material, name, color = self._last_selection
+        self.store_measurement(data, data_snv=data_snv, name=name, material=material, color=color)
 
     def store_measurement(
         self,
         data: list[float],
+        data_snv: np.ndarray | None = None,
         name: str = "",
         material: str = "unknown",
         color: str = "",
@@ -417,15 +691,21 @@ class PsPlot(QMainWindow):
     ) -> None:
         """adds newest measurement to table and dataframe"""
 
-        data_snv = snv_transform(data)
+        # one float64 conversion up front, snv/normalize and the table,
+        # dataframe and 3D consumers below all share this buffer
+        data = np.asarray(data, dtype=np.float64)
+        if data_snv is None:
+            data_snv = snv_transform(data)
 
         if calibrated_measurement:
-            data_normalized = [1] * len(data)
+            data_normalized = np.ones(len(data))
         else:
             if self.baseline is not None:
                 data_normalized = normalize(data, self.baseline)
             else:
-                data_normalized = [None] * len(data)
+                # nan keeps the normalized columns float64, None would force
+                # them to object dtype on every later dataframe read
+                data_normalized = np.full(len(data), np.nan)
 
         self.currently_storing = True
         self.store_to_dataframe(
@@ -446,14 +726,9 @@ class PsPlot(QMainWindow):
         )
 
         if not calibrated_measurement:
-            if material not in self.scatter3d.unique_series:
-                self.scatter3d.unique_series[material] = {}
-            if name not in self.scatter3d.unique_series[material]:
-                self.scatter3d.unique_series[material][name] = {"data": []}
-
-            self.scatter3d.unique_series[material][name]["data"].append(
-                data + data_snv + data_normalized
-            )
+            if self.scatter3d is None:
+                self._setup_deferred_plots()
+            self.scatter3d.add_point(material, name, [*data, *data_snv, *data_normalized])
 
         self.currently_storing = False
 
@@ -461,7 +736,7 @@ class PsPlot(QMainWindow):
         self,
         data: list[float],
         data_snv: list[float],
-        data_normalized: list[float | None],
+        data_normalized: np.ndarray,
         name: str = "",
         material: str = "unknown",
         color: str = "",
@@ -472,21 +747,91 @@ class PsPlot(QMainWindow):
         else:
             measurement_type = "regular"
 
-        self.df.loc[len(self.df)] = [
+        self._pending_rows.append([
             name,
             material,
             color,
             measurement_type,
-            datetime.now(),
+            # a bare integer, much cheaper than building a Timestamp here;
+            # _flush_df converts the batch to datetime64 in one pass
+            time.time_ns(),
             *data,
             *data_snv,
             *data_normalized,
-        ]
+        ])
+
+        # bound the buffer so a long unattended session still flushes in
+        # batches instead of accumulating everything until the next read
+        if len(self._pending_rows) >= settings.DATAFRAME.FLUSH_BATCH_SIZE:
+            self._flush_df()
+
+    def _flush_df(self) -> None:
+        """folds the pending measurement rows into self.df
+        anything that reads self.df calls this first, so the dataframe is
+        built with one bulk concat instead of one O(N) insert per measurement
+
+        a preallocated frame with a fill watermark would avoid the concat
+        copy as well, but every reader would then need an iloc[:n] view and
+        string columns would still reallocate; with batched flushes the
+        concat happens rarely enough that the simpler buffer wins
+        """
+        if not self._pending_rows:
+            return
+        new_rows = pd.DataFrame(self._pending_rows, columns=settings.DATAFRAME.HEADER)
+        # the buffered epoch nanoseconds become datetime64 in one vectorized
+        # pass, shifted to local wall-clock time like datetime.now() gave
+        new_rows["DateTime"] = (
+            pd.to_datetime(new_rows["DateTime"], unit="ns", utc=True)
+            .dt.tz_convert(_LOCAL_TZ)
+            .dt.tz_localize(None)
+        )
+        if len(self.df) == 0:
+            self.df = new_rows
+        else:
+            # concat with the object-dtype pending rows decays the
+            # dictionary-encoded string columns of a loaded dataset back to
+            # object; accepted, the encoding only needs to survive the
+            # load-time groupby and sample-set rebuild
+            self.df = pd.concat([self.df, new_rows], ignore_index=True, copy=False)
+        self._pending_rows.clear()
 
     def _update_df_after_table_change(self, column, row, value):
-        self.df.loc[row, column] = value
+        self._flush_df()
+        # after a dataset load this column may be dictionary-encoded and a
+        # categorical rejects values its dictionary has not seen yet
+        if isinstance(self.df[column].dtype, pd.CategoricalDtype):
+            if value not in self.df[column].cat.categories:
+                self.df[column] = self.df[column].cat.add_categories([value])
+        # iat with the precomputed position skips the label-indexing
+        # machinery; the table row is positional, which also keeps edits
+        # correct when a loaded dataset has a non-contiguous Reading index
+        self.df.iat[row, self._df_col_idx[column]] = value
+
+    def last_prediction_input(self) -> tuple[float, ...]:
+        """the classifier input columns of the latest measurement
+        served straight from the pending buffer when possible, so the
+        histogram redraw after every scan does not force a dataframe flush
+        """
+        if self._pending_rows:
+            row = self._pending_rows[-1]
+            return tuple(row[i] for i in self._prediction_indices)
+        return tuple(self.df.loc[len(self.df) - 1, settings.CLASSIFIER.PREDICTION_HEADERS])
+
+    def _predict_proba(self, vec: tuple[float, ...]):
+        """runs the classifier on a single measurement
+        `vec` holds the values of the settings.CLASSIFIER.PREDICTION_HEADERS
+        columns, as a tuple so the result can be memoized (see predict_proba)
+        """
+        # a pre-shaped ndarray skips the one-row DataFrame construction
+        # (index and block allocation) that sklearn would strip away anyway
+        row = np.asarray(vec, dtype=np.float64).reshape(1, -1)
+        return self.clf.predict_proba(row)[0]
 
     def calibrate(self) -> None:
+        # calibration reads the port synchronously, it must not run while
+        # a worker-thread measurement holds the serial handle
+        if self._measuring:
+            return
         button = QMessageBox.question(
             self, "Calibration", "Is the spectralon sample on the sensor?"
         )
@@ -498,19 +843,25 @@ class PsPlot(QMainWindow):
                 self.regularMeasurementBtn.setEnabled(True)
                 self.regularMeasurementBtn.setToolTip("")
 
-            self.baseline = self.get_measurement()
+            # kept as a float64 ndarray so every normalize() against the
+            # baseline divides ndarray by ndarray without re-conversion
+            self.baseline = np.asarray(self.get_measurement(), dtype=np.float64)
             self.current_calibration_counter += 1
             self.total_calibration_counter += 1
             self.store_measurement(self.baseline, calibrated_measurement=True)
 
             # after a calibration calibration the plot is cleared
             self.scatter2d.plot()
+            # the baseline changed, an identical spectrum now draws
+            # differently so the dedup hash no longer holds
+            self._last_2d_hash = None
 
     def clear_calibration(self) -> None:
         self.baseline = None
         # after a calibration calibration the plot is cleared
         self.twoDPlottedList.clear()
         self.scatter2d.clear()
+        self._last_2d_hash = None
 
     def load_dataset_online(self) -> None:
         QMessageBox.information(
@@ -518,7 +869,53 @@ class PsPlot(QMainWindow):
             "loading dataset",
             f"Dataset is loaded from url:\n{settings.DATAFRAME.DATASET_URL}",
         )
-        self.load_dataset(settings.DATAFRAME.DATASET_URL)
+        try:
+            dataset_path = self._fetch_online_dataset()
+        except (urllib.error.URLError, OSError) as e:
+            QMessageBox.critical(
+                self,
+                "loading dataset",
+                "Dataset could not be downloaded\n\n"
+                + f"{e}\n\n"
+                + "For help, please contact the PlasticScanner Team",
+            )
+            return
+        self.load_dataset(dataset_path)
+
+    def _fetch_online_dataset(self) -> str:
+        """downloads the online dataset into the local cache and returns its path
+
+        the ETag of the last download is sent along as If-None-Match, so an
+        unchanged dataset answers with a bodyless 304 (one round trip) and the
+        cached csv is reused; when offline the cached copy is used as-is
+
+        the parse of the cached csv is itself memoized on path and mtime
+        (_read_dataset), so a warm online load costs one conditional
+        request plus a pickle read, no csv parse
+        """
+        cache_dir = Path.home() / ".cache" / "psplot"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cached_csv = cache_dir / "measurement.csv"
+        cached_etag = cache_dir / "measurement.etag"
+
+        request = urllib.request.Request(settings.DATAFRAME.DATASET_URL)
+        if cached_csv.exists() and cached_etag.exists():
+            request.add_header("If-None-Match", cached_etag.read_text().strip())
+        try:
+            with urllib.request.urlopen(request, timeout=10) as response:
+                cached_csv.write_bytes(response.read())
+                etag = response.headers.get("ETag")
+                if etag:
+                    cached_etag.write_text(etag)
+        except urllib.error.HTTPError as e:
+            # 304 Not Modified means the cached copy is still current
+            if e.code != 304:
+                raise
+        except urllib.error.URLError:
+            # offline, fall back to the cached copy when there is one
+            if not cached_csv.exists():
+                raise
+        return str(cached_csv)
 
     def load_dataset_local(self) -> None:
         filename, _ = QFileDialog.getOpenFileName(
@@ -556,14 +953,24 @@ class PsPlot(QMainWindow):
 
     def load_dataset(self, dataset_path: str) -> None:
         """load a dataset to continue where that dataset last left off"""
+        self._flush_df()
         # give warnings that there is data and it will get overwritten
         if len(self.df) > 0:
             if not (self._load_dataset_warning() and self._load_dataset_warning_really()):
                 return
 
-        new_df = pd.read_csv(
-            dataset_path, index_col="Reading", dtype=settings.DATAFRAME.HEADER_DTYPES
-        )
+        try:
+            new_df = _read_dataset(dataset_path, os.path.getmtime(dataset_path))
+        except ValueError as e:
+            QMessageBox.critical(
+                self,
+                "Load dataset",
+                "Dataset could not be loaded because of missing columns\n\n"
+                + f"{e}\n\n"
+                + "COULD NOT LOAD NEW DATASET!\n\n"
+                + "For help, please contact the PlasticScanner Team",
+            )
+            return
         if list(new_df.columns) != settings.DATAFRAME.HEADER:
             QMessageBox.critical(
                 self,
@@ -576,35 +983,49 @@ class PsPlot(QMainWindow):
             )
             return
 
+        # stored as text in the csv, parsed once here so the column matches
+        # the datetime64 timestamps of new measurements
+        new_df["DateTime"] = pd.to_datetime(new_df["DateTime"], errors="coerce")
+        # dictionary-encode the high-repetition string columns, the groupby
+        # and sample-set rebuilds below then work on the small category
+        # table instead of hashing a python string per row
+        for column in ("Name", "PlasticType", "Color", "MeasurementType"):
+            new_df[column] = new_df[column].astype("category")
         self.df = new_df
+        self._nm_block = np.asfortranarray(
+            self.df[settings.SCATTER3D.AXIS_OPTIONS].to_numpy(dtype=np.float64)
+        )
 
         # clear plots
+        # the 3d plot and histogram build lazily, make sure they exist
+        if self.scatter3d is None:
+            self._setup_deferred_plots()
         # clear 3d plot
         self.scatter3d.clear()
         # build the datastructure needed for 3dplot
-        self.scatter3d.unique_series = {
-            material: {} for material in self.df["PlasticType"].unique()
-        }
-        for _, row in self.df.iterrows():
-            name = row["Name"]
-            material = row["PlasticType"]
-            if name not in self.scatter3d.unique_series[material]:
-                self.scatter3d.unique_series[material][name] = {"data": []}
-
-            self.scatter3d.unique_series[material][name]["data"].append(
-                row[settings.SCATTER3D.AXIS_OPTIONS]
-            )
+        # one group per series instead of a python object per row; nan
+        # names are kept so no measurement silently disappears
+        # observed=True because on categorical keys the default enumerates
+        # every category combination, present in the data or not
+        groups = self.df.groupby(
+            ["PlasticType", "Name"], sort=False, dropna=False, observed=True
+        ).indices
+        for (material, name), indices in groups.items():
+            self.scatter3d.add_points(material, name, self._nm_block[indices])
 
         # clear 2d plot and histogram
         self.scatter2d.clear()
+        self._last_2d_hash = None
         self.histogram.clear()
 
         # reset variables
         # reset calibration counter
-        self.sample_names = set(self.df["Name"])
-        self.sample_colors = set(self.df["Color"])
-        self.sample_materials = settings.USER_INPUT.DEFAULT_SAMPLE_MATERIALS.copy()
-        self.sample_materials.extend(list(set(self.df["PlasticType"]) - set(self.sample_materials)))
+        # the category table is exactly the unique values, so no row scan
+        self.sample_names = set(self.df["Name"].cat.categories)
+        self.sample_colors = set(self.df["Color"].cat.categories)
+        self.sample_materials = set(settings.USER_INPUT.DEFAULT_SAMPLE_MATERIALS)
+        self.sample_materials |= set(self.df["PlasticType"].cat.categories)
+        self._last_selection_raw = None
         self.current_calibration_counter = 0
         self.total_calibration_counter = 0
         self.clear_calibration()
@@ -612,26 +1033,32 @@ class PsPlot(QMainWindow):
         # clear table
         self.table.clear()
         # build table
-        for _idx, row in self.df.iterrows():
-            name = row["Name"] if isinstance(row["Name"], str) else ""
-            plasticType = row["PlasticType"] if isinstance(row["PlasticType"], str) else ""
-            color = row["Color"] if isinstance(row["Color"], str) else ""
-            if row["MeasurementType"] == "calibration":
-                self.total_calibration_counter += 1
-                self.table.append(
-                    row[settings.TABLE.DATAFRAME_SUBSET_HEADERS],
-                    name=name,
-                    material=plasticType,
-                    color=color,
-                    calibrated_measurement=True,
-                )
-            else:
+        # columns are pulled out of the dataframe once instead of creating a
+        # pd.Series per row with iterrows, so the label-to-position lookup
+        # for the measurement subset happens once rather than per row;
+        # non-string cells (nan from the csv) become "" in one vectorized
+        # pass
+        # astype(object) first: these columns are dictionary-encoded after a
+        # load and a categorical refuses the "" fill value
+        names = self.df["Name"].astype(object)
+        names = names.where(names.map(type).eq(str), "").to_numpy()
+        plastic_types = self.df["PlasticType"].astype(object)
+        plastic_types = plastic_types.where(plastic_types.map(type).eq(str), "").to_numpy()
+        colors = self.df["Color"].astype(object)
+        colors = colors.where(colors.map(type).eq(str), "").to_numpy()
+        calibrated = (self.df["MeasurementType"] == "calibration").to_numpy()
+        data_rows = self.df[settings.TABLE.DATAFRAME_SUBSET_HEADERS].to_numpy()
+        self.total_calibration_counter += int(calibrated.sum())
+        with self.table.bulk_update():
+            for name, plasticType, color, is_calibration, data in zip(
+                names, plastic_types, colors, calibrated, data_rows
+            ):
                 self.table.append(
-                    row[settings.TABLE.DATAFRAME_SUBSET_HEADERS],
+                    data,
                     name=name,
                     material=plasticType,
                     color=color,
-                    calibrated_measurement=False,
+                    calibrated_measurement=bool(is_calibration),
                 )
 
         self.scatter2d.plot()
@@ -649,11 +1076,18 @@ class PsPlot(QMainWindow):
         else:
             if "." not in fname:
                 fname = fname + ".csv"
-            self.df.to_csv(fname, index_label="Reading")
+            self._flush_df()
+            # chunked write keeps peak memory bounded on long sessions and
+            # the explicit float format uses the fast C formatter at the
+            # same 7-decimal precision the table shows, instead of repr
+            self.df.to_csv(
+                fname, index_label="Reading", chunksize=50_000, float_format="%.7f"
+            )
 
 
 def main():
-    print(f"App is running on QT version {QT_VERSION_STR}")
+    logging.basicConfig(level=logging.INFO)
+    _LOG.info("App is running on QT version %s", QT_VERSION_STR)
     app = pg.mkQApp()
 
     # this should add some optimisations for high-DPI screens
@@ -665,7 +1099,12 @@ def main():
     elif QT_version >= 5.14 and QT_version < 5.14:
         app.setAttribute(Qt.AA_EnableHighDpiScaling)
         app.setAttribute(Qt.AA_UseHighDpiPixmaps)
-    pg.setConfigOptions(antialias=True)  # , crashWarning=True)
+    # useOpenGL moves the 2D rasterization to the GPU, which keeps large
+    # loaded datasets responsive where the software painter collapses;
+    # useNumba/enableExperimental are deliberately off, numba is not a
+    # dependency and the experimental paths are not worth it for 8-point
+    # curves
+    pg.setConfigOptions(antialias=True, useOpenGL=True)  # , crashWarning=True)
 
     window = PsPlot()
     window.show()
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 from PyQt5.QtGui import QColor
 
 
@@ -10,7 +11,13 @@ class HARDWARE:
     """Hardware constants of the plastic scanner."""
 
     # the HARDWARE.WAVELENGTHS of the LED's in nanometers
-    WAVELENGTHS = [940, 1050, 1200, 1300, 1450, 1550, 1650, 1720]
+    # a tuple so accidental mutation fails loudly
+    WAVELENGTHS = (940, 1050, 1200, 1300, 1450, 1550, 1650, 1720)
+    # contiguous float32 copy of WAVELENGTHS, pyqtgraph accepts this without copying
+    WAVELENGTHS_ARR = np.ascontiguousarray(WAVELENGTHS, dtype=np.float32)
+    # plot bounds, precomputed so UI code never rescans the tuple
+    WAVELENGTHS_MIN = min(WAVELENGTHS)
+    WAVELENGTHS_MAX = max(WAVELENGTHS)
     # the baud rate of the used microcontroller
     BAUDRATE = 9600
 
@@ -53,6 +60,11 @@ class DATAFRAME:
         + [f"nm{x}_norm" for x in HARDWARE.WAVELENGTHS]
         + [f"nm{x}_snv" for x in HARDWARE.WAVELENGTHS]
     )
+    # how many pending measurement rows may pile up before they are folded
+    # into the dataframe even when nothing reads it
+    FLUSH_BATCH_SIZE = 64
+    # pre-declared column dtypes so read_csv skips inference; floats stay
+    # float64 on purpose, the numeric pipeline works in float64 throughout
     HEADER_DTYPES = (
         {
             "Name": str,
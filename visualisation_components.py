@@ -8,22 +8,15 @@
 
 from __future__ import annotations
 
+import logging
 from abc import ABC, ABCMeta, abstractmethod
-from collections import deque
+from collections import defaultdict
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
-import pandas as pd
-
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtDataVisualization import (
-    Q3DCamera,
-    Q3DScatter,
-    Q3DTheme,
-    QAbstract3DGraph,
-    QScatter3DSeries,
-    QScatterDataItem,
-    QScatterDataProxy,
-)
+import numpy as np
+
+from PyQt5.QtCore import QAbstractTableModel, QEvent, QModelIndex, Qt, pyqtSignal
 from PyQt5.QtGui import (
     QColor,
     QVector3D,
@@ -39,8 +32,7 @@ from PyQt5.QtWidgets import (
     QLabel,
     QPushButton,
     QRadioButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
@@ -49,11 +41,24 @@ from PyQt5.QtWidgets import (
 import pyqtgraph as pg
 
 import settings
-from helper_functions import list_to_string, normalize
+from helper_functions import normalize
 
 if TYPE_CHECKING:
     from psplot import PsPlot
 
+_LOG = logging.getLogger(__name__)
+
+
+def _qt3d():
+    """deferred import of PyQt5.QtDataVisualization
+    importing it brings up an OpenGL stack, so it only happens once the 3D
+    scatter plot is actually constructed (cheap afterwards, python caches
+    the module)
+    """
+    from PyQt5 import QtDataVisualization
+
+    return QtDataVisualization
+
 
 class PSplotVisual(ABCMeta, type(QBoxLayout)):
     """
@@ -92,12 +97,23 @@ class ScatterPlot2D(QVBoxLayout, PlotLayout):
         super().__init__()
         self._parent = parent
         self._changing_plot = False
-
-        # used for also plotting previous values
-        self.plot_history = deque(maxlen=3)
+        # can be turned off (e.g. in tests) to get every sample drawn
+        self._downsample_enabled = True
+
+        # preallocated ring buffer holding the last measurements, used for
+        # also plotting previous values without per-redraw list/array
+        # rebuilds; any range reduction over the history is one numpy
+        # reduction over _hist_buf[:_hist_fill]
+        self._hist_buf = np.empty((3, len(settings.HARDWARE.WAVELENGTHS)))
+        # the normalized baseline is always a row of ones (baseline divided
+        # by itself), allocate it once instead of recomputing per redraw
+        self._normalized_baseline = np.ones(len(settings.HARDWARE.WAVELENGTHS), dtype=np.float32)
+        self._hist_head = 0
+        self._hist_fill = 0
 
         self._init_plot_widget()
         self._init_button_control()
+        self.refresh_palette()
         self.addWidget(self._plotWidget, 80)
         self.addLayout(self._controlLayout, 20)
 
@@ -110,14 +126,24 @@ class ScatterPlot2D(QVBoxLayout, PlotLayout):
         self._plotWidget.setMenuEnabled(True)
         self._plotWidget.showGrid(x=True, y=True, alpha=0.5)
         self._plotWidget.setMouseEnabled(x=False, y=True)
-
-        pc = self._plotWidget.plot()
-        pc.setSymbol("o")
-
-        xPadding = min(settings.HARDWARE.WAVELENGTHS) * 0.1
+        if self._downsample_enabled:
+            # skip off-screen segments and reduce the per-paint point count
+            self._plotWidget.setDownsampling(auto=True, mode="peak")
+            self._plotWidget.setClipToView(True)
+
+        # persistent plot items, redraws only swap their data buffers
+        # instead of destroying and recreating scene-graph items
+        self._baseline_item = self._plotWidget.plot([], [], pen=(255, 0, 0))
+        self._hist_items = [
+            self._plotWidget.plot([], [], pen=(0, 100, 0), symbol="x", symbolBrush=(0, 255, 0))
+            for _ in range(self._hist_buf.shape[0])
+        ]
+        self._data_item = self._plotWidget.plot([], [], symbol="o")
+
+        xPadding = settings.HARDWARE.WAVELENGTHS_MIN * 0.1
         self._plotItem.setLimits(
-            xMin=min(settings.HARDWARE.WAVELENGTHS) - xPadding,
-            xMax=max(settings.HARDWARE.WAVELENGTHS) + xPadding,
+            xMin=settings.HARDWARE.WAVELENGTHS_MIN - xPadding,
+            xMax=settings.HARDWARE.WAVELENGTHS_MAX + xPadding,
         )
 
         # self.twoDPlotItem.setLabel("left", "NIR output", units="V", unitPrefix="m")
@@ -127,8 +153,8 @@ class ScatterPlot2D(QVBoxLayout, PlotLayout):
         self._plotItem.setTitle("Reflectance")
 
         self._plotWidget.setXRange(
-            min(settings.HARDWARE.WAVELENGTHS),
-            max(settings.HARDWARE.WAVELENGTHS),
+            settings.HARDWARE.WAVELENGTHS_MIN,
+            settings.HARDWARE.WAVELENGTHS_MAX,
             padding=0.1,
         )
 
@@ -170,54 +196,81 @@ class ScatterPlot2D(QVBoxLayout, PlotLayout):
         if not self._changing_plot:
             self._autoRangeChbx.setChecked(False)
 
+    def refresh_palette(self) -> None:
+        """rebuilds the palette derived pen, called once at setup and again
+        when the application palette changes, instead of per redraw
+        """
+        line_color = tuple(self._parent.palette().text().color().getRgb())
+        mark_color = tuple(self._parent.palette().highlight().color().getRgb())
+        # one shared pen, applied here so redraws never touch pen state
+        self._data_pen = pg.mkPen(color=line_color, symbolBrush=mark_color, symbolPen="o", width=2)
+        self._data_item.setPen(self._data_pen)
+
     @property
     def plotWidget(self) -> pg.PlotWidget:
         return self._plotWidget
 
     def clear(self) -> None:
         self._changing_plot = True
-        self.plot_history.clear()
+        self._hist_head = 0
+        self._hist_fill = 0
         self._parent.twoDPlottedList.clear()
-        self._plotWidget.clear()
+        self._data_item.setData([], [])
+        self._data_item.hide()
         self.plot()
         self._changing_plot = False
 
     def plot(self, data: list[float] | None = None) -> None:
         self._changing_plot = True
-        self._plotWidget.clear()
 
         # add the baseline of the last calibration
         if self._parent.baseline is not None:
-            normalized_baseline = [1] * len(self._parent.baseline)
-            pc = self._plotWidget.plot(
-                settings.HARDWARE.WAVELENGTHS, normalized_baseline, pen=(255, 0, 0)
+            self._baseline_item.setData(
+                settings.HARDWARE.WAVELENGTHS_ARR,
+                self._normalized_baseline,
+                skipFiniteCheck=True,
             )
-            self._parent.twoDPlottedList.append(normalized_baseline)
-
-        for dat in self.plot_history:
+            self._baseline_item.show()
+            self._parent.twoDPlottedList.append(self._normalized_baseline)
+        else:
+            self._baseline_item.setData([], [])
+            self._baseline_item.hide()
+
+        if self._hist_fill:
+            # the ring buffer rows from oldest to newest as one block
+            order = [
+                (self._hist_head - self._hist_fill + i) % 3 for i in range(self._hist_fill)
+            ]
+            hist = self._hist_buf[order]
             if self._parent.baseline is not None:
-                dat = normalize(dat, self._parent.baseline)
-            self._parent.twoDPlottedList.append(dat)
-            pc = self._plotWidget.plot(
-                settings.HARDWARE.WAVELENGTHS,
-                dat,
-                pen=(0, 100, 0),
-                symbolBrush=(0, 255, 0),
-            )
-            pc.setSymbol("x")
+                # normalize handles the whole (fill, 8) batch in one call,
+                # broadcast column math rather than anything row-by-row
+                hist = normalize(hist, self._parent.baseline)
+            # contiguous float32 is handed to pyqtgraph without a copy
+            hist = np.ascontiguousarray(hist, dtype=np.float32)
+        for i, item in enumerate(self._hist_items):
+            if i < self._hist_fill:
+                dat = hist[i]
+                self._parent.twoDPlottedList.append(dat)
+                item.setData(settings.HARDWARE.WAVELENGTHS_ARR, dat, skipFiniteCheck=True)
+                item.show()
+            else:
+                item.setData([], [])
+                item.hide()
 
         if data is not None:
-            self.plot_history.append(data)
+            self._hist_buf[self._hist_head] = np.asarray(data)
+            self._hist_head = (self._hist_head + 1) % 3
+            self._hist_fill = min(3, self._hist_fill + 1)
 
-        line_color = tuple(self._parent.palette().text().color().getRgb())
-        mark_color = tuple(self._parent.palette().highlight().color().getRgb())
-
-        pen = pg.mkPen(color=line_color, symbolBrush=mark_color, symbolPen="o", width=2)
         if data is not None:
             if self._parent.baseline is not None:
                 data = normalize(data, self._parent.baseline)
-            pc = self._plotWidget.plot(settings.HARDWARE.WAVELENGTHS, data, pen=pen)
-            pc.setSymbol("o")
+            data = np.ascontiguousarray(data, dtype=np.float32)
+            self._data_item.setData(
+                settings.HARDWARE.WAVELENGTHS_ARR, data, skipFiniteCheck=True
+            )
+            self._data_item.show()
 
         self._changing_plot = False
 
@@ -242,12 +295,15 @@ class ScatterPlot3D(QVBoxLayout, PlotLayout):
         self.setSpacing(0)
 
     def _init_variables(self) -> None:
-        self._axis_options_index_map = {
+        self._axis_to_col = {
             name: index for index, name in enumerate(settings.SCATTER3D.AXIS_OPTIONS)
         }
         self._axis_var_x = settings.SCATTER3D.AXIS_VAR_X_DEFAULT
         self._axis_var_z = settings.SCATTER3D.AXIS_VAR_Y_DEFAULT
         self._axis_var_y = settings.SCATTER3D.AXIS_VAR_Z_DEFAULT
+        # column indices into the numeric block, refreshed on axis change so
+        # plot() never translates axis names again
+        self._update_axis_columns()
 
         # hierarchical datastructure that is used to speed up plotting
         # has 2 special keys that are not materials but represent groups
@@ -257,7 +313,8 @@ class ScatterPlot3D(QVBoxLayout, PlotLayout):
         # {
         #     material: {
         #         id/name: {
-        #             "data": [data1, data2, ...],
+        #             "arr": (capacity, 24) float64 array with the points,
+        #             "n": how many rows of "arr" are filled,
         #             "proxy": proxy,
         #             "series": series,
         #         }
@@ -267,14 +324,26 @@ class ScatterPlot3D(QVBoxLayout, PlotLayout):
         # could also use fancy custom typehint
         self.unique_series = {material: {} for material in settings.SCATTER3D.ALLOWED_MATERIALS}
 
+        # one reusable (QColor, "rgb(r, g, b)") pair per material, so the
+        # legend stylesheets and the per-series colors never rebuild these;
+        # each series is colored once via setBaseColor at creation, points
+        # carry no per-item brush at all
+        self._material_styles: dict[str, tuple[QColor, str]] = {}
+        for name, color in settings.SCATTER3D.COLOR_MAP.items():
+            rgb = color.getRgb()
+            self._material_styles[name] = (color, f"rgb({rgb[0]}, {rgb[1]}, {rgb[2]});")
+
     def _init_plot_widget(self) -> None:
-        self._graph = Q3DScatter()
+        qt3d = _qt3d()
+        self._graph = qt3d.Q3DScatter()
         self._plotWidget = QWidget.createWindowContainer(self._graph)
 
         self._graph.setHorizontalAspectRatio(1.0)
         self._graph.setAspectRatio(1.0)
         self._graph.setOrthoProjection(True)
-        self._graph.scene().activeCamera().setCameraPreset(Q3DCamera.CameraPresetIsometricLeft)
+        self._graph.scene().activeCamera().setCameraPreset(
+            qt3d.Q3DCamera.CameraPresetIsometricLeft
+        )
 
         self._graph.axisX().setTitle(settings.SCATTER3D.AXIS_VAR_X_DEFAULT)
         self._graph.axisX().setTitleVisible(True)
@@ -295,44 +364,45 @@ class ScatterPlot3D(QVBoxLayout, PlotLayout):
         self._graph.axisZ().setLabelFormat("")
 
         # styling
-        self._graph.setShadowQuality(QAbstract3DGraph.ShadowQuality(0))
+        self._graph.setShadowQuality(qt3d.QAbstract3DGraph.ShadowQuality(0))
 
+        # the palette and theme font are introspected once, every call into
+        # palette()/font() allocates a fresh copy
+        palette = self._parent.palette()
         currentTheme = self._graph.activeTheme()
-        currentTheme.setType(Q3DTheme.Theme(0))
+        currentTheme.setType(qt3d.Q3DTheme.Theme(0))
         currentTheme.setBackgroundEnabled(False)
         currentTheme.setLabelBackgroundEnabled(False)
-        currentTheme.setLabelTextColor(QColor(self._parent.palette().text().color()))
+        currentTheme.setLabelTextColor(palette.text().color())
         currentTheme.setAmbientLightStrength(1)
         currentTheme.setLightStrength(1)
         currentTheme.setHighlightLightStrength(1)
-        currentTheme.setColorStyle(Q3DTheme.ColorStyleUniform)
+        currentTheme.setColorStyle(qt3d.Q3DTheme.ColorStyleUniform)
         currentTheme.setGridEnabled(True)
-        back = QColor(self._parent.palette().window().color())
+        back = palette.window().color()
         currentTheme.setBackgroundColor(back)
         currentTheme.setWindowColor(back)
-        fontsize = currentTheme.font().pointSizeF()
         font = currentTheme.font()
-        font.setPointSizeF(4 * fontsize)
+        font.setPointSizeF(4 * font.pointSizeF())
         currentTheme.setFont(font)
 
     def _init_button_control(self) -> None:
         # legend
         self._legendLayout = QHBoxLayout()
         self._legend_buttons = {}
-        for name, color in settings.SCATTER3D.COLOR_MAP.items():
+        for name, (_, rgb_str) in self._material_styles.items():
             label = QLabel()
             button = QPushButton(name)
             button.setCheckable(True)
             button.setChecked(True)
             button.clicked.connect(self.plot)
-            rgb = color.getRgb()
             button.setStyleSheet(
                 """
                 QPushButton:checked{
                         color: black;
                         background-color:
                 """
-                + f"rgb({rgb[0]}, {rgb[1]}, {rgb[2]});"
+                + rgb_str
                 + """
                         }
 
@@ -340,7 +410,7 @@ class ScatterPlot3D(QVBoxLayout, PlotLayout):
                         color: black;
                         background-color:
                 """
-                + f"rgb({rgb[0]}, {rgb[1]}, {rgb[2]});"
+                + rgb_str
                 + """
                         }
                 """
@@ -348,9 +418,7 @@ class ScatterPlot3D(QVBoxLayout, PlotLayout):
 
             label.setText(name)
             label.setStyleSheet(
-                "QLabel { background-color : "
-                + f"rgb({rgb[0]}, {rgb[1]}, {rgb[2]});"
-                + " color : black; }"
+                "QLabel { background-color : " + rgb_str + " color : black; }"
             )
             # self.threeDPlotLegendLayout.addWidget(label)
             self._legendLayout.addWidget(button)
@@ -393,19 +461,27 @@ class ScatterPlot3D(QVBoxLayout, PlotLayout):
 
     def _ax_x_changed(self, name) -> None:
         self._axis_var_x = name
+        self._update_axis_columns()
         self._graph.axisX().setTitle(self._axis_var_x)
         self.plot(axis_changed=True)
 
     def _ax_y_changed(self, name) -> None:
         self._axis_var_y = name
+        self._update_axis_columns()
         self._graph.axisY().setTitle(self._axis_var_y)
         self.plot(axis_changed=True)
 
     def _ax_z_changed(self, name) -> None:
         self._axis_var_z = name
+        self._update_axis_columns()
         self._graph.axisZ().setTitle(self._axis_var_z)
         self.plot(axis_changed=True)
 
+    def _update_axis_columns(self) -> None:
+        self._col_x = self._axis_to_col[self._axis_var_x]
+        self._col_y = self._axis_to_col[self._axis_var_y]
+        self._col_z = self._axis_to_col[self._axis_var_z]
+
     def _switch_axes_to_snv(self) -> None:
         """
         Switches normalized axes to SNV axes since it's assumed that
@@ -413,17 +489,58 @@ class ScatterPlot3D(QVBoxLayout, PlotLayout):
         present when taking readings without first taking a calibration
         measurement.
         """
-        print("WARNING: trying to plot point on normalized axis while non normalized data is present!")
-        print("\tSWITCHING TO DISPLAYING NON NORMALIZED DATA...")
+        _LOG.warning(
+            "trying to plot point on normalized axis while non normalized "
+            "data is present! switching to displaying non normalized data"
+        )
         self._axis_var_x = self._axis_var_x.replace("_norm", "_snv")
         self._axis_var_y = self._axis_var_y.replace("_norm", "_snv")
         self._axis_var_z = self._axis_var_z.replace("_norm", "_snv")
+        self._update_axis_columns()
         self._axXSelection.setCurrentText(self._axis_var_x)
         self._axYSelection.setCurrentText(self._axis_var_y)
         self._axZSelection.setCurrentText(self._axis_var_z)
 
         self.plot(axis_changed=True)
 
+    def add_point(self, material: str, id: str, row) -> None:
+        """appends one point (all 24 numeric columns) to a series
+        points live in a preallocated contiguous float32 array that doubles
+        when full, so appending stays O(1) amortized instead of growing a
+        python list of lists that plot() has to reconvert every redraw;
+        float32 is what the render buffers take anyway and halves the
+        per-series footprint; None entries become nan
+        """
+        entry = self.unique_series.setdefault(material, {}).setdefault(id, {})
+        if "arr" not in entry:
+            entry["arr"] = np.empty(
+                (4, len(settings.SCATTER3D.AXIS_OPTIONS)), dtype=np.float32
+            )
+            entry["n"] = 0
+        arr = entry["arr"]
+        if entry["n"] == arr.shape[0]:
+            arr = np.vstack((arr, np.empty_like(arr)))
+            entry["arr"] = arr
+        arr[entry["n"]] = np.asarray(row, dtype=np.float32)
+        entry["n"] += 1
+
+    def add_points(self, material: str, id: str, block: np.ndarray) -> None:
+        """bulk variant of add_point, appends an (N, 24) block in one copy"""
+        block = np.asarray(block, dtype=np.float32)
+        entry = self.unique_series.setdefault(material, {}).setdefault(id, {})
+        if "arr" not in entry:
+            entry["arr"] = np.empty(
+                (max(4, len(block)), block.shape[1]), dtype=np.float32
+            )
+            entry["n"] = 0
+        arr = entry["arr"]
+        n = entry["n"]
+        while n + len(block) > arr.shape[0]:
+            arr = np.vstack((arr, np.empty_like(arr)))
+        entry["arr"] = arr
+        arr[n : n + len(block)] = block
+        entry["n"] = n + len(block)
+
     def clear(self) -> None:
         for material in self.unique_series:
             for id in self.unique_series[material]:
@@ -436,9 +553,10 @@ class ScatterPlot3D(QVBoxLayout, PlotLayout):
         """axis_changed: true if the variable of
         one of the axes was changed by the user
         """
-        index_x = self._axis_options_index_map[self._axis_var_x]
-        index_y = self._axis_options_index_map[self._axis_var_y]
-        index_z = self._axis_options_index_map[self._axis_var_z]
+        qt3d = _qt3d()
+        index_x = self._col_x
+        index_y = self._col_y
+        index_z = self._col_z
         for material in self.unique_series:
             if material not in settings.SCATTER3D.ALLOWED_MATERIALS:
                 if material == "":
@@ -448,11 +566,11 @@ class ScatterPlot3D(QVBoxLayout, PlotLayout):
             else:
                 material_name = material
 
-            color = settings.SCATTER3D.COLOR_MAP[material_name]
+            color = self._material_styles[material_name][0]
             for id in self.unique_series[material]:
                 if "proxy" not in self.unique_series[material][id]:
-                    proxy = QScatterDataProxy()
-                    series = QScatter3DSeries(proxy)
+                    proxy = qt3d.QScatterDataProxy()
+                    series = qt3d.QScatter3DSeries(proxy)
 
                     name = f"{id} | {material}"
                     series.setName(name)
@@ -460,7 +578,7 @@ class ScatterPlot3D(QVBoxLayout, PlotLayout):
                     series.setItemLabelFormat("@seriesName")
                     series.setMeshSmooth(True)
                     series.setBaseColor(color)
-                    series.setColorStyle(Q3DTheme.ColorStyleUniform)
+                    series.setColorStyle(qt3d.Q3DTheme.ColorStyleUniform)
 
                     self.unique_series[material][id]["proxy"] = proxy
                     self.unique_series[material][id]["series"] = series
@@ -470,34 +588,32 @@ class ScatterPlot3D(QVBoxLayout, PlotLayout):
                     series = self.unique_series[material][id]["series"]
 
                 if self._legend_buttons[material_name].isChecked():
-                    if (
-                        len(self.unique_series[material][id]["data"]) > len(proxy.array())
-                        or axis_changed
-                    ):
-                        # if none of the datapoints are None
-                        if not any(
-                            [
-                                data[index_x] is None
-                                or data[index_y] is None
-                                or data[index_z] is None
-                                for data in self.unique_series[material][id]["data"]
-                            ]
-                        ):
-                            dataArray = [
-                                QScatterDataItem(
-                                    QVector3D(
-                                        data[index_x],
-                                        data[index_y],
-                                        data[index_z],
-                                    )
-                                )
-                                for data in self.unique_series[material][id]["data"]
-                            ]
-
-                            proxy.resetArray(dataArray)
-                        else:
+                    entry = self.unique_series[material][id]
+                    n = entry["n"]
+                    n_proxy = entry.get("n_proxy", 0)
+                    if axis_changed or n > n_proxy:
+                        # slice the plotted columns out of the filled part of
+                        # the series array, on a plain new measurement only
+                        # the unplotted tail; missing values are nan so a
+                        # single isnan covers the per-point None checks
+                        start = 0 if axis_changed else n_proxy
+                        block = entry["arr"][start:n, (index_x, index_y, index_z)]
+                        if np.isnan(block).any():
                             self._switch_axes_to_snv()
                             return
+                        dataArray = [
+                            qt3d.QScatterDataItem(QVector3D(x, y, z))
+                            for x, y, z in block.tolist()
+                        ]
+                        if axis_changed:
+                            # one full rebuild of the render buffers
+                            proxy.resetArray(dataArray)
+                        else:
+                            # append only the new points, a regular
+                            # measurement costs O(new points) and never
+                            # rebuilds the other series' arrays
+                            proxy.addItems(dataArray)
+                        entry["n_proxy"] = n
 
                         if series not in self._graph.seriesList():
                             self._graph.addSeries(series)
@@ -537,24 +653,22 @@ class Histogram(QVBoxLayout, PlotLayout):
 
         axis = self._plotWidget.getAxis("left")
         # the labels for the vertical axis, they are flipped because
-        # humans read from top to bottom
-        vertical_axis = dict(
-            enumerate(
-                self._parent.clf.classes_[::-1],
-                start=1,
-            )
-        )
-        axis.setTicks([vertical_axis.items()])
+        # humans read from top to bottom; the class order never changes so
+        # the default tick list is built once and reused on every redraw
+        self._classes_reversed = list(self._parent.clf.classes_[::-1])
+        self._default_ticks = [list(enumerate(self._classes_reversed, start=1))]
+        axis.setTicks(self._default_ticks)
         axis.setStyle(tickLength=0)
 
         axis = self._plotWidget.getAxis("bottom")
         axis.setTicks([{x: str(x) for x in range(0, 120, 20)}.items()])
 
-        yticks = list(range(1, len(self._parent.clf.classes_) + 1))
+        # the bar rows never change, one item per class
+        self._yticks = list(range(1, len(self._parent.clf.classes_) + 1))
         widths = [0] * len(self._parent.clf.classes_)
         self._bars = pg.BarGraphItem(
             x0=0,
-            y=yticks,
+            y=self._yticks,
             height=0.8,
             width=widths,
             brush=QColor(self._parent.palette().highlight().color()),
@@ -562,7 +676,7 @@ class Histogram(QVBoxLayout, PlotLayout):
         self._plotWidget.addItem(self._bars)
         # draw the text for each bar
         self._texts = []
-        for x, y in zip(widths, yticks):
+        for x, y in zip(widths, self._yticks):
             if x >= 50:
                 text = pg.TextItem(text=str(x), anchor=(1, 0.5))
                 text.setPos(x, y)
@@ -607,6 +721,13 @@ class Histogram(QVBoxLayout, PlotLayout):
 
         self._disableBtn.click()  # start with bar graph disabled
 
+    def refresh_palette(self) -> None:
+        """re-derives the bar brush after an application palette change
+        the one brush is shared by every bar, per-redraw setOpts calls
+        never rebuild it
+        """
+        self._bars.setOpts(brush=QColor(self._parent.palette().highlight().color()))
+
     def _sorting_selection_changed(self) -> None:
         self.plot()
 
@@ -627,21 +748,13 @@ class Histogram(QVBoxLayout, PlotLayout):
     def plot(self) -> None:
         if self._disableBtn.isChecked():
             return
-        data = self._parent.df.loc[len(self._parent.df) - 1, settings.CLASSIFIER.PREDICTION_HEADERS]
-        data = pd.DataFrame([data], columns=settings.CLASSIFIER.PREDICTION_HEADERS)
-        ##############
-        # Define a function to remove the last 4 characters from a column name
-        def remove_last_4_chars(column_name):
-            return column_name[:-5]
-
-        # Rename the columns by applying the function to each column name
-        data.columns = data.columns.map(remove_last_4_chars)        
-        ##################
+        vec = self._parent.last_prediction_input()
+        # one memoized classifier call for all classes
+        probabilities = self._parent.predict_proba(vec)
         prediction = {
-            plastic: self._parent.clf.predict_proba(data)[0][idx] * 100
+            plastic: probabilities[idx] * 100
             for idx, plastic in enumerate(self._parent.clf.classes_)
         }
-        yticks = list(range(1, len(prediction) + 1))
         # the order of the predicted values is flipped here because the
         # labels are also flipped
         widths = [int(x) for x in list(prediction.values())[::-1]]
@@ -652,58 +765,49 @@ class Histogram(QVBoxLayout, PlotLayout):
 
         axis = self._plotWidget.getAxis("left")
         if self._sortDefaultBtn.isChecked():
-            # the labels for the vertical axis, they are flipped because
-            # humans read from top to bottom
-            vertical_axis = dict(
-                enumerate(
-                    self._parent.clf.classes_[::-1],
-                    start=1,
-                )
-            )
+            # precomputed in _init_plot_widget, the class order is fixed
+            axis.setTicks(self._default_ticks)
         elif self._sortCertaintyBtn.isChecked():
+            # sorted by score, this ordering depends on the data so the
+            # tick list has to be rebuilt per redraw
             widths, names = map(
                 list,
-                zip(*sorted(zip(widths, self._parent.clf.classes_[::-1]))),
+                zip(*sorted(zip(widths, self._classes_reversed))),
             )
-            vertical_axis = dict(
-                enumerate(
-                    names,
-                    start=1,
-                )
-            )
-
-        axis.setTicks([vertical_axis.items()])
+            axis.setTicks([list(enumerate(names, start=1))])
 
-        self._update_plot(yticks, widths)
+        self._update_plot(self._yticks, widths)
 
     def _update_plot(self, yticks, widths) -> None:
-        self._bars.setOpts(y=yticks, width=widths)
+        # the bar rows are fixed, only the widths change between redraws,
+        # so the persistent BarGraphItem gets exactly one option updated
+        self._bars.setOpts(width=widths)
         for x, y, text in zip(widths, yticks, self._texts):
+            # keep the label inside the bar once it passes the middle
             if x >= 50:
-                text.setAnchor = (1, 0.5)
+                text.setAnchor((1, 0.5))
             else:
-                text.setAnchor = (0, 0.5)
+                text.setAnchor((0, 0.5))
             text.setText(str(x))
             text.setPos(x, y)
 
     def clear(self) -> None:
         """set the position of all of the bars to 0"""
-        yticks = list(range(1, len(self._parent.clf.classes_) + 1))
         widths = [0] * len(self._parent.clf.classes_)
-        self._update_plot(yticks, widths)
+        self._update_plot(self._yticks, widths)
 
     def export(self) -> None:
         return NotImplemented
 
 
-class Table(QTableWidget):
-    """
-    this class extends QTableWidget
-    - supports copying multiple cell's text onto the clipboard
-    - formatted specifically to work with multiple-cell paste into programs
-      like google sheets, excel, or numbers
-    - autocomplete functionality for certain columns
-    Taken and modified from https://stackoverflow.com/a/68598423/5539470
+class SpectraTableModel(QAbstractTableModel):
+    """model that backs the measurement table
+    the named cells are kept as strings and the measured values as floats;
+    QTableWidget would wrap every cell in a QTableWidgetItem, while a model
+    only serves cell text on demand through data(), which keeps insertion
+    and memory cost low for long measurement sessions; dataset loads feed
+    it through append_rows (one insert notification per batch) and clear
+    through reset()
     """
 
     # when the user manually makes a change to data in the table, this will emit a signal
@@ -714,27 +818,172 @@ class Table(QTableWidget):
     # str : the new value
     user_change = pyqtSignal(str, int, str)
 
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        # text of the named cells and values of the numeric cells per row,
+        # the labels for the most left column and whether the row was a
+        # calibration measurement
+        self._rows: list[list[str]] = []
+        self._values: list[list[float]] = []
+        self._row_labels: list[str] = []
+        self._calibrated: list[bool] = []
+        # palette derived background of calibration rows, cached because
+        # data() runs for every painted cell (see refresh_palette)
+        self.refresh_palette()
+
+    def rowCount(self, parent: QModelIndex | None = None) -> int:
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent: QModelIndex | None = None) -> int:
+        if parent is not None and parent.isValid():
+            return 0
+        return len(settings.TABLE.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            column = index.column()
+            if column < settings.TABLE.N_NAMED_HEADERS:
+                return self._rows[index.row()][column]
+            # measured values are formatted lazily, only the cells that are
+            # actually painted pay for the float to string conversion
+            value = self._values[index.row()][column - settings.TABLE.N_NAMED_HEADERS]
+            return f"{value:.7f}"
+        # use a different color if the measurement was taken for calibration
+        if role == Qt.ItemDataRole.BackgroundRole and self._calibrated[index.row()]:
+            return self._calibration_bg
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole) -> bool:
+        """Called when the user manually modifies a cell, a signal is emitted."""
+        if role != Qt.ItemDataRole.EditRole or not index.isValid():
+            return False
+        if index.column() >= settings.TABLE.N_NAMED_HEADERS:
+            return False
+        self._rows[index.row()][index.column()] = str(value)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
+        self.user_change.emit(
+            settings.TABLE.HEAD_TO_DF[settings.TABLE.HEADERS[index.column()]],
+            index.row(),
+            str(value),
+        )
+        return True
+
+    def flags(self, index):
+        flags = super().flags(index)
+        # only the name/material/color columns are editable by hand
+        if index.column() < settings.TABLE.N_NAMED_HEADERS:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        # row labels are served one section at a time on demand; appending a
+        # row never re-submits the whole accumulated label list to the view
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return settings.TABLE.HEADERS[section]
+        return self._row_labels[section]
+
+    def refresh_palette(self) -> None:
+        self._calibration_bg = QApplication.palette().alternateBase().color()
+
+    def append_row(
+        self,
+        cells: list[str],
+        values: list[float],
+        label: str,
+        calibrated_measurement: bool,
+    ) -> None:
+        n_rows = len(self._rows)
+        self.beginInsertRows(QModelIndex(), n_rows, n_rows)
+        self._rows.append(cells)
+        self._values.append(values)
+        self._row_labels.append(label)
+        self._calibrated.append(calibrated_measurement)
+        self.endInsertRows()
+
+    def append_rows(
+        self,
+        rows: list[list[str]],
+        values: list[list[float]],
+        labels: list[str],
+        calibrated: list[bool],
+    ) -> None:
+        """bulk append, one insert notification for the whole batch
+        the view repaints once after endInsertRows, there are no per-cell
+        item widgets or itemChanged emissions to suppress
+        """
+        n_rows = len(self._rows)
+        self.beginInsertRows(QModelIndex(), n_rows, n_rows + len(rows) - 1)
+        self._rows.extend(rows)
+        self._values.extend(values)
+        self._row_labels.extend(labels)
+        self._calibrated.extend(calibrated)
+        self.endInsertRows()
+
+    def reset(self) -> None:
+        self.beginResetModel()
+        self._rows = []
+        self._values = []
+        self._row_labels = []
+        self._calibrated = []
+        self.endResetModel()
+
+
+class Table(QTableView):
+    """
+    view onto SpectraTableModel
+    - supports copying multiple cell's text onto the clipboard
+    - formatted specifically to work with multiple-cell paste into programs
+      like google sheets, excel, or numbers
+    Taken and modified from https://stackoverflow.com/a/68598423/5539470
+    """
+
+    # re-emitted from the model, see SpectraTableModel.user_change
+    user_change = pyqtSignal(str, int, str)
+
     def __init__(
         self,
     ) -> None:
         super().__init__()
 
-        self.setColumnCount(len(settings.TABLE.HEADERS))
-        self.setHorizontalHeaderLabels(settings.TABLE.HEADERS)
+        self._model = SpectraTableModel(self)
+        self.setModel(self._model)
+        self._model.user_change.connect(self.user_change)
 
         # make the first 2 columns extra wide
         self.setColumnWidth(0, 200)
         self.setColumnWidth(1, 200)
 
-        self.itemChanged.connect(self._user_modification)
-
-        # the labels for the most left column
-        self._row_labels = []
         # how many times a calibrated measurement has been appended
         self._calibration_counter = 0
-
-        # true when table is changing due to function call
-        self._currently_appending = False
+        # true while appending many rows inside bulk_update()
+        self._bulk_updating = False
+        # rows collected during bulk_update(), handed to the model in one go
+        self._pending_appends: list[tuple] = []
+
+    @contextmanager
+    def bulk_update(self):
+        """Use around batches of append() calls (e.g. dataset load).
+        Viewport repaints and scrolling are suspended while appending and
+        performed once at the end.
+        """
+        self.setUpdatesEnabled(False)
+        self._bulk_updating = True
+        try:
+            yield
+        finally:
+            self._bulk_updating = False
+            if self._pending_appends:
+                cells, values, labels, calibs = map(list, zip(*self._pending_appends))
+                self._model.append_rows(cells, values, labels, calibs)
+                self._pending_appends.clear()
+            self.setUpdatesEnabled(True)
+            self.scrollToBottom()
 
     def append(
         self,
@@ -749,63 +998,37 @@ class Table(QTableWidget):
         A calibrated row is highlighted with a different background color
         and given a different index in the left column.
         """
-        self._currently_appending = True
-        n_rows = self.rowCount()
-        # add a row
-        self.setRowCount(n_rows + 1)
-
-        # add sample name as column 0
-        # self.setItem(n_rows, 0, QTableWidgetItem(name))
-        self.setItem(n_rows, 0, QTableWidgetItem(name))
-
-        # add sample material as column 1
-        self.setItem(n_rows, 1, QTableWidgetItem(material))
-
-        # add sample color as column 2
-        self.setItem(n_rows, 2, QTableWidgetItem(color))
-
         if calibrated_measurement:
             self._calibration_counter += 1
-            self._row_labels.append(f"c {self._calibration_counter}")
-            self.setItem(n_rows, 1, QTableWidgetItem("spectralon"))
+            label = f"c {self._calibration_counter}"
+            material = "spectralon"
         else:
-            self._row_labels.append(str(n_rows + 1 - self._calibration_counter))
-
-        self.setVerticalHeaderLabels(self._row_labels)
-
-        # add value for every column of new row
-        data_str = list_to_string(data)
-        for col, val in enumerate(data_str, start=settings.TABLE.N_NAMED_HEADERS):
-            cell = QTableWidgetItem(val)
-            # disable editing of cells
-            cell.setFlags(cell.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            # use a different color if the measurement was taken for calibration
-            self.setItem(n_rows, col, cell)
-
-        # apply different background color for calibration measurement
-        if calibrated_measurement:
-            for column in range(self.columnCount()):
-                self.item(n_rows, column).setBackground(self.palette().alternateBase().color())
-
-        self.scrollToBottom()
-        self._currently_appending = False
+            n_rows = self._model.rowCount() + len(self._pending_appends)
+            label = str(n_rows + 1 - self._calibration_counter)
+
+        # tolist() unboxes numpy scalars to plain floats, which format
+        # faster when the model renders the cells
+        values = data.tolist() if hasattr(data, "tolist") else list(data)
+        if self._bulk_updating:
+            self._pending_appends.append(
+                ([name, material, color], values, label, calibrated_measurement)
+            )
+        else:
+            self._model.append_row(
+                [name, material, color], values, label, calibrated_measurement
+            )
+            self.scrollToBottom()
 
     def clear(self) -> None:
         """Clears the contents of the table."""
-        self.clearContents()
-        self.setRowCount(0)
-        self._row_labels = []
+        self._model.reset()
+        self._calibration_counter = 0
 
-    def _user_modification(self, item: QTableWidgetItem) -> None:
-        """Called when cell of the table changed.
-        When this change is due to a user manually modifying a value, a signal is emitted.
-        """
-        if self._currently_appending is False:
-            self.user_change.emit(
-                settings.TABLE.HEAD_TO_DF[settings.TABLE.HEADERS[item.column()]],
-                item.row(),
-                item.text(),
-            )
+    def changeEvent(self, event) -> None:
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.PaletteChange:
+            self._model.refresh_palette()
+            self.viewport().update()
 
     def keyPressEvent(self, event) -> None:
         """Enables copying from the table using CTRL-C."""
@@ -813,15 +1036,14 @@ class Table(QTableWidget):
 
         if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
             if event.key() == Qt.Key.Key_C:
-                copied_cells = sorted(self.selectedIndexes())
-
-                copy_text = ""
-                max_column = copied_cells[-1].column()
-                for c in copied_cells:
-                    copy_text += self.item(c.row(), c.column()).text()
-                    if c.column() == max_column:
-                        copy_text += "\n"
-                    else:
-                        copy_text += "\t"
-
+                # group the selected cells per row and join once, repeated
+                # string concatenation is quadratic in the number of cells
+                # one row-major sort up front, the insertion order of the
+                # dict then keeps both rows and columns sorted; the
+                # clipboard is written once for the whole block
+                rows: dict[int, list[str]] = defaultdict(list)
+                for idx in sorted(self.selectedIndexes()):
+                    rows[idx.row()].append(idx.data())
+
+                copy_text = "\n".join("\t".join(cells) for cells in rows.values())
                 QApplication.clipboard().setText(copy_text)